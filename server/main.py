@@ -3,22 +3,25 @@ AI Health Symptom Analyzer - Backend Server
 A FastAPI-based medical symptom analysis application using AI
 """
 
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Depends, Query, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.requests import Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+import asyncio
 import os
-import json
+import re
+import msgspec
+import orjson
 import httpx
 from datetime import datetime
-import uuid
-import PyPDF2
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LRUCache, TTLCache
+from itertools import islice
+import hashlib
 from dotenv import load_dotenv
+import bcrypt
 import pathlib
 
 # Load environment variables
@@ -27,16 +30,27 @@ load_dotenv()
 app = FastAPI(
     title="AI Health Symptom Analyzer",
     description="An AI-powered health symptom analysis and preliminary diagnosis tool",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend access
+# Wildcard origins with credentials are invalid per spec and force the
+# middleware to do extra per-request work; allow only known origins
+frontend_origins = [
+    origin.strip()
+    for origin in os.getenv(
+        "FRONTEND_ORIGINS", "http://localhost:8000,http://127.0.0.1:8000"
+    ).split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=frontend_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["authorization", "content-type"],
 )
 
 # Mount static files and templates
@@ -58,10 +72,103 @@ else:
         # If mounting fails on Vercel, that's okay - Vercel will serve them
         pass
 
-templates = Jinja2Templates(directory=str(templates_dir))
+# The HTML pages are fully static (no template variables), so read them once
+# at import time instead of rendering through Jinja on every request
+_INDEX_HTML = (templates_dir / "index.html").read_bytes()
+_DASHBOARD_HTML = (templates_dir / "dashboard.html").read_bytes()
+
+@app.on_event("startup")
+async def startup_http_client():
+    """Create a shared HTTP client so Groq calls reuse pooled connections"""
+    app.state.http_client = httpx.AsyncClient(
+        timeout=30.0,
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=30.0
+        )
+    )
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    """Close the shared HTTP client"""
+    await app.state.http_client.aclose()
+
+# Upload limits: only the first ~4000 chars of text reach the AI prompt,
+# so there is no reason to accept huge files or parse every page
+MAX_PDF_BYTES = 25 * 1024 * 1024  # 25MB
+MAX_EXTRACTED_CHARS = 8000
+MAX_PARSE_PAGES = 32
+
+# Matches a JSON object inside a markdown code fence (the LLM usually
+# returns ```json ... ``` around its structured output)
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+# Throttle concurrent outbound Groq calls so burst traffic doesn't trip
+# upstream rate limits (tune to the API tier)
+_GROQ_SEMAPHORE = asyncio.Semaphore(16)
+_GROQ_MAX_ATTEMPTS = 3
+
+# Identical prompts (common symptom combinations, repeat questions) hit
+# this cache instead of paying another multi-second Groq call
+_GROQ_RESPONSE_CACHE = TTLCache(maxsize=4096, ttl=3600)
+
+def _new_id() -> str:
+    """Generate a random hex ID without the UUID object and hyphen formatting"""
+    return os.urandom(16).hex()
+
+# Password hashing (bcrypt runs in native code)
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12)).decode()
+
+def _verify_password(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode(), hashed.encode())
+
+# Constant strings shared across requests, built once at import time
+_SYSTEM_MSG = {
+    "role": "system",
+    "content": """You are a helpful medical AI assistant. You provide preliminary health information based on symptoms described.
+
+IMPORTANT DISCLAIMERS:
+- You are NOT a replacement for professional medical advice
+- Always recommend consulting a healthcare provider for proper diagnosis
+- In case of emergency symptoms, advise immediate medical attention
+- Provide educational information only
+
+Format your responses as structured JSON with the following fields:
+- preliminary_assessment: A brief overview of the symptoms
+- possible_conditions: An array of objects with {name, likelihood, description}
+- recommendations: An array of actionable advice
+- urgency_level: One of "low", "moderate", "high", "emergency"
+- when_to_seek_help: Specific warning signs to watch for"""
+}
+
+_ANALYSIS_DISCLAIMER = (
+    "This analysis is for informational purposes only and does not constitute "
+    "medical advice. Always consult a qualified healthcare provider for proper "
+    "diagnosis and treatment."
+)
+
+_REPORT_DISCLAIMER = (
+    "This analysis is for informational purposes only. Please discuss these "
+    "results with your healthcare provider."
+)
+
+_SYMPTOM_PROMPT_SUFFIX = """
+    Please provide:
+    1. A preliminary assessment of these symptoms
+    2. Possible conditions that could cause these symptoms (with likelihood)
+    3. Recommended next steps
+    4. Urgency level (low/moderate/high/emergency)
+    5. Warning signs that would require immediate medical attention
+
+    Remember: This is for educational purposes only and not a medical diagnosis.
+    """
 
 # In-memory storage (replace with database in production)
-analyses_db = {}
+# Bounded so long-running processes can't grow without limit
+analyses_db = LRUCache(maxsize=10_000)
 users_db = {}
 
 # =============================================================================
@@ -69,7 +176,7 @@ users_db = {}
 # =============================================================================
 
 class SymptomInput(BaseModel):
-    symptoms: List[str] = Field(..., min_length=1, description="List of symptoms")
+    symptoms: list[str] = Field(..., min_length=1, description="List of symptoms")
     duration: str = Field(..., description="How long symptoms have been present")
     severity: str = Field(..., description="Severity level: mild, moderate, severe")
     age: int = Field(..., ge=0, le=150, description="Patient age")
@@ -81,12 +188,14 @@ class ChatMessage(BaseModel):
     context: Optional[str] = Field(None, description="Previous conversation context")
 
 class AnalysisResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     analysis_id: str
     timestamp: str
-    symptoms: List[str]
+    symptoms: list[str]
     preliminary_assessment: str
-    possible_conditions: List[dict]
-    recommendations: List[str]
+    possible_conditions: list[dict]
+    recommendations: list[str]
     urgency_level: str
     disclaimer: str
 
@@ -100,6 +209,16 @@ class UserLogin(BaseModel):
     email: str
     password: str
 
+class AIAnalysis(msgspec.Struct):
+    """Expected shape of the Groq JSON output; decoded and validated in C"""
+    preliminary_assessment: str = "Analysis complete"
+    possible_conditions: list[dict] = []
+    recommendations: list[str] = []
+    urgency_level: str = "moderate"
+
+# Compiled once; decode + validation runs in a single C pass
+_AI_ANALYSIS_DECODER = msgspec.json.Decoder(AIAnalysis)
+
 # =============================================================================
 # AI Analysis Functions
 # =============================================================================
@@ -110,11 +229,71 @@ async def get_ai_analysis(prompt: str) -> str:
     Falls back to a structured response if API is unavailable
     """
     groq_api_key = os.getenv("GROQ_API_KEY")
+
+    # blake2b runs in C and is faster than sha256; 16 bytes is plenty
+    # for cache keying
+    cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+    cached = _GROQ_RESPONSE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if groq_api_key:
+        try:
+            client = app.state.http_client
+            async with _GROQ_SEMAPHORE:
+                for attempt in range(_GROQ_MAX_ATTEMPTS):
+                    response = await client.post(
+                        "https://api.groq.com/openai/v1/chat/completions",
+                        headers={
+                            "Authorization": f"Bearer {groq_api_key}",
+                            "Content-Type": "application/json"
+                        },
+                        json={
+                            "model": "llama-3.3-70b-versatile",
+                            "messages": [
+                                _SYSTEM_MSG,
+                                {"role": "user", "content": prompt}
+                            ],
+                            "temperature": 0.3,
+                            "max_tokens": 2000
+                        }
+                    )
+
+                    if response.status_code == 200:
+                        result = response.json()
+                        content = result["choices"][0]["message"]["content"]
+                        _GROQ_RESPONSE_CACHE[cache_key] = content
+                        return content
+
+                    # Retry rate limits and server errors with exponential
+                    # backoff, honoring Retry-After when Groq sends one
+                    if response.status_code == 429 or response.status_code >= 500:
+                        if attempt < _GROQ_MAX_ATTEMPTS - 1:
+                            retry_after = response.headers.get("Retry-After")
+                            delay = float(retry_after) if retry_after else 0.5 * (2 ** attempt)
+                            await asyncio.sleep(delay)
+                            continue
+                    break
+        except Exception as e:
+            print(f"Groq API error: {e}")
     
+    # Fallback response if API unavailable
+    return generate_fallback_response()
+
+async def stream_ai_analysis(prompt: str):
+    """
+    Stream AI analysis from the Groq API as Server-Sent Events
+    Yields content deltas as they arrive; falls back to a single event
+    carrying the canned response if the API is unavailable
+    """
+    groq_api_key = os.getenv("GROQ_API_KEY")
+
     if groq_api_key:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            client = app.state.http_client
+            async with _GROQ_SEMAPHORE:
+                async with client.stream(
+                    "POST",
                     "https://api.groq.com/openai/v1/chat/completions",
                     headers={
                         "Authorization": f"Bearer {groq_api_key}",
@@ -123,43 +302,36 @@ async def get_ai_analysis(prompt: str) -> str:
                     json={
                         "model": "llama-3.3-70b-versatile",
                         "messages": [
-                            {
-                                "role": "system",
-                                "content": """You are a helpful medical AI assistant. You provide preliminary health information based on symptoms described. 
-                                
-IMPORTANT DISCLAIMERS:
-- You are NOT a replacement for professional medical advice
-- Always recommend consulting a healthcare provider for proper diagnosis
-- In case of emergency symptoms, advise immediate medical attention
-- Provide educational information only
-
-Format your responses as structured JSON with the following fields:
-- preliminary_assessment: A brief overview of the symptoms
-- possible_conditions: An array of objects with {name, likelihood, description}
-- recommendations: An array of actionable advice
-- urgency_level: One of "low", "moderate", "high", "emergency"
-- when_to_seek_help: Specific warning signs to watch for"""
-                            },
+                            _SYSTEM_MSG,
                             {"role": "user", "content": prompt}
                         ],
                         "temperature": 0.3,
-                        "max_tokens": 2000
-                    },
-                    timeout=30.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    return result["choices"][0]["message"]["content"]
+                        "max_tokens": 2000,
+                        "stream": True
+                    }
+                ) as response:
+                    if response.status_code == 200:
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data: "):
+                                continue
+                            data = line[6:]
+                            if data == "[DONE]":
+                                break
+                            delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                            if delta:
+                                yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+                        yield b"data: [DONE]\n\n"
+                        return
         except Exception as e:
             print(f"Groq API error: {e}")
-    
-    # Fallback response if API unavailable
-    return generate_fallback_response()
+
+    # Fallback: emit the canned response as one event
+    yield b"data: " + orjson.dumps({"delta": generate_fallback_response()}) + b"\n\n"
+    yield b"data: [DONE]\n\n"
 
 def generate_fallback_response() -> str:
     """Generate a helpful fallback response when AI API is unavailable"""
-    return json.dumps({
+    return orjson.dumps({
         "preliminary_assessment": "Based on the symptoms provided, I can offer some general health information. However, for accurate diagnosis, please consult a healthcare professional.",
         "possible_conditions": [
             {
@@ -176,16 +348,45 @@ def generate_fallback_response() -> str:
         ],
         "urgency_level": "moderate",
         "when_to_seek_help": "Seek immediate medical attention if you experience: difficulty breathing, chest pain, sudden severe headache, high fever, or any symptoms that are rapidly worsening."
-    })
+    }).decode()
 
 def extract_text_from_pdf(pdf_file: bytes) -> str:
     """Extract text content from uploaded PDF file"""
+    # Imported lazily so cold starts for non-PDF routes don't pay the
+    # cost of loading the MuPDF C library (subsequent imports are cached)
+    import pymupdf
+
+    def _page_text(index: int) -> str:
+        return doc.load_page(index).get_text("text")
+
     try:
-        pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_file))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
+        doc = pymupdf.open(stream=pdf_file, filetype="pdf")
+        try:
+            page_count = min(doc.page_count, MAX_PARSE_PAGES)
+            if page_count <= 1:
+                pages = [_page_text(i) for i in range(page_count)]
+            else:
+                # get_text releases the GIL, so pages extract in parallel
+                workers = min(page_count, os.cpu_count() or 4)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    pages = list(pool.map(_page_text, range(page_count)))
+
+            chunks = []
+            total_chars = 0
+            for page_text in pages:
+                if not page_text:
+                    # Likely a scanned/image-only page; nothing to extract without OCR
+                    continue
+                chunks.append(page_text)
+                total_chars += len(page_text)
+                if total_chars >= MAX_EXTRACTED_CHARS:
+                    break
+            text = "\n".join(chunks)
+        finally:
+            doc.close()
         return text.strip()
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error reading PDF: {str(e)}")
 
@@ -194,14 +395,14 @@ def extract_text_from_pdf(pdf_file: bytes) -> str:
 # =============================================================================
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
-    """Render the home page"""
-    return templates.TemplateResponse("index.html", {"request": request})
+async def home():
+    """Serve the home page"""
+    return HTMLResponse(content=_INDEX_HTML)
 
 @app.get("/dashboard", response_class=HTMLResponse)
-async def dashboard(request: Request):
-    """Render the user dashboard"""
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+async def dashboard():
+    """Serve the user dashboard"""
+    return HTMLResponse(content=_DASHBOARD_HTML)
 
 @app.get("/health-check")
 async def health_check():
@@ -218,11 +419,16 @@ async def signup(user: UserSignup):
     if user.email in users_db:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    user_id = str(uuid.uuid4())
+    # Hashing is deliberately slow (~100ms), so keep it off the event loop
+    hashed_password = await asyncio.get_running_loop().run_in_executor(
+        None, _hash_password, user.password
+    )
+
+    user_id = _new_id()
     users_db[user.email] = {
         "id": user_id,
         "email": user.email,
-        "password": user.password,  # In production, hash this!
+        "password": hashed_password,
         "name": user.name,
         "user_type": user.user_type,
         "created_at": datetime.now().isoformat()
@@ -238,8 +444,14 @@ async def signup(user: UserSignup):
 async def login(credentials: UserLogin):
     """Authenticate user"""
     user = users_db.get(credentials.email)
-    
-    if not user or user["password"] != credentials.password:
+
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    password_ok = await asyncio.get_running_loop().run_in_executor(
+        None, _verify_password, credentials.password, user["password"]
+    )
+    if not password_ok:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
     return {
@@ -254,13 +466,13 @@ async def login(credentials: UserLogin):
 # API Routes - Symptom Analysis
 # =============================================================================
 
-@app.post("/api/analyze/symptoms", response_model=AnalysisResponse)
+@app.post("/api/analyze/symptoms")
 async def analyze_symptoms(symptoms_data: SymptomInput):
     """
     Analyze user symptoms and provide preliminary health information
     """
-    analysis_id = str(uuid.uuid4())
-    
+    analysis_id = _new_id()
+
     # Build the prompt for AI analysis
     prompt = f"""
     Please analyze the following health symptoms and provide a structured assessment:
@@ -275,16 +487,7 @@ async def analyze_symptoms(symptoms_data: SymptomInput):
     
     **Duration:** {symptoms_data.duration}
     **Severity:** {symptoms_data.severity}
-    
-    Please provide:
-    1. A preliminary assessment of these symptoms
-    2. Possible conditions that could cause these symptoms (with likelihood)
-    3. Recommended next steps
-    4. Urgency level (low/moderate/high/emergency)
-    5. Warning signs that would require immediate medical attention
-    
-    Remember: This is for educational purposes only and not a medical diagnosis.
-    """
+    """ + _SYMPTOM_PROMPT_SUFFIX
     
     # Get AI analysis
     ai_response = await get_ai_analysis(prompt)
@@ -292,37 +495,45 @@ async def analyze_symptoms(symptoms_data: SymptomInput):
     try:
         # Try to parse JSON from AI response
         # Handle cases where response might be wrapped in markdown code blocks
-        if "```json" in ai_response:
-            ai_response = ai_response.split("```json")[1].split("```")[0]
-        elif "```" in ai_response:
-            ai_response = ai_response.split("```")[1].split("```")[0]
-        
-        analysis_data = json.loads(ai_response)
-    except json.JSONDecodeError:
-        # If parsing fails, use the raw response
-        analysis_data = {
-            "preliminary_assessment": ai_response,
-            "possible_conditions": [],
-            "recommendations": ["Please consult a healthcare professional for accurate diagnosis"],
-            "urgency_level": "moderate"
-        }
+        match = _JSON_FENCE.search(ai_response)
+        if match:
+            ai_response = match.group(1)
+
+        analysis_data = _AI_ANALYSIS_DECODER.decode(ai_response)
+    except msgspec.DecodeError:
+        # If parsing fails, use the raw response; every field here is a
+        # known-safe literal or validated input, so skip re-validation
+        response = AnalysisResponse.model_construct(
+            analysis_id=analysis_id,
+            timestamp=datetime.now().isoformat(),
+            symptoms=symptoms_data.symptoms,
+            preliminary_assessment=ai_response,
+            possible_conditions=[],
+            recommendations=["Please consult a healthcare professional for accurate diagnosis"],
+            urgency_level="moderate",
+            disclaimer=_ANALYSIS_DISCLAIMER
+        )
+    else:
+        # Build response
+        response = AnalysisResponse(
+            analysis_id=analysis_id,
+            timestamp=datetime.now().isoformat(),
+            symptoms=symptoms_data.symptoms,
+            preliminary_assessment=analysis_data.preliminary_assessment,
+            possible_conditions=analysis_data.possible_conditions,
+            recommendations=analysis_data.recommendations,
+            urgency_level=analysis_data.urgency_level,
+            disclaimer=_ANALYSIS_DISCLAIMER
+        )
     
-    # Build response
-    response = AnalysisResponse(
-        analysis_id=analysis_id,
-        timestamp=datetime.now().isoformat(),
-        symptoms=symptoms_data.symptoms,
-        preliminary_assessment=analysis_data.get("preliminary_assessment", "Analysis complete"),
-        possible_conditions=analysis_data.get("possible_conditions", []),
-        recommendations=analysis_data.get("recommendations", []),
-        urgency_level=analysis_data.get("urgency_level", "moderate"),
-        disclaimer="This analysis is for informational purposes only and does not constitute medical advice. Always consult a qualified healthcare provider for proper diagnosis and treatment."
-    )
-    
-    # Store analysis
-    analyses_db[analysis_id] = response.dict()
-    
-    return response
+    # Store the serialized bytes: far cheaper to keep in memory than an
+    # inflated dict tree, and reads become zero-parse pass-throughs
+    payload = orjson.dumps(response.model_dump())
+    analyses_db[analysis_id] = payload
+
+    # The model was validated at construction; return the serialized bytes
+    # directly rather than paying a second response_model validation pass
+    return Response(content=payload, media_type="application/json")
 
 @app.post("/api/analyze/report")
 async def analyze_medical_report(file: UploadFile = File(...)):
@@ -332,15 +543,28 @@ async def analyze_medical_report(file: UploadFile = File(...)):
     if not file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
-    # Read and extract text from PDF
-    pdf_content = await file.read()
-    extracted_text = extract_text_from_pdf(pdf_content)
+    if file.size is not None and file.size > MAX_PDF_BYTES:
+        raise HTTPException(status_code=413, detail="PDF file too large (25MB limit)")
+
+    # Read the upload in chunks so an oversized or mislabeled file can't
+    # exhaust memory before the size cap is enforced
+    buffer = bytearray()
+    while chunk := await file.read(1 << 20):
+        buffer.extend(chunk)
+        if len(buffer) > MAX_PDF_BYTES:
+            raise HTTPException(status_code=413, detail="PDF file too large (25MB limit)")
+    pdf_content = bytes(buffer)
+
+    # Parsing is CPU-bound, so run it in a threadpool to keep the event loop free
+    extracted_text = await asyncio.get_running_loop().run_in_executor(
+        None, extract_text_from_pdf, pdf_content
+    )
     
     if not extracted_text:
         raise HTTPException(status_code=400, detail="Could not extract text from PDF")
     
-    analysis_id = str(uuid.uuid4())
-    
+    analysis_id = _new_id()
+
     # Build prompt for medical report analysis
     prompt = f"""
     Please analyze the following medical report and provide a patient-friendly summary:
@@ -365,7 +589,7 @@ async def analyze_medical_report(file: UploadFile = File(...)):
         "timestamp": datetime.now().isoformat(),
         "filename": file.filename,
         "analysis": ai_response,
-        "disclaimer": "This analysis is for informational purposes only. Please discuss these results with your healthcare provider."
+        "disclaimer": _REPORT_DISCLAIMER
     }
 
 @app.post("/api/chat")
@@ -384,29 +608,33 @@ async def health_chat(chat_data: ChatMessage):
     3. Recommending professional consultation when appropriate
     4. Avoiding definitive diagnoses
     """
-    
-    response = await get_ai_analysis(prompt)
-    
-    return {
-        "response": response,
-        "timestamp": datetime.now().isoformat()
-    }
+
+    # Stream tokens as they arrive so the client sees a response in
+    # hundreds of milliseconds rather than waiting for the full completion
+    return StreamingResponse(stream_ai_analysis(prompt), media_type="text/event-stream")
 
 # =============================================================================
 # API Routes - History & Data
 # =============================================================================
 
 @app.get("/api/analyses")
-async def get_all_analyses():
-    """Get all stored analyses (for demo purposes)"""
-    return {"analyses": list(analyses_db.values())}
+async def get_all_analyses(limit: int = Query(50, ge=0), offset: int = Query(0, ge=0)):
+    """Get stored analyses, paginated (for demo purposes)"""
+    # Stored values are already-serialized JSON, so splice the bytes
+    # together directly instead of re-encoding each analysis
+    page = islice(analyses_db.values(), offset, offset + limit)
+    body = (
+        b'{"analyses":[' + b",".join(page) + b'],'
+        b'"limit":%d,"offset":%d,"total":%d}' % (limit, offset, len(analyses_db))
+    )
+    return Response(content=body, media_type="application/json")
 
 @app.get("/api/analyses/{analysis_id}")
 async def get_analysis(analysis_id: str):
     """Get a specific analysis by ID"""
     if analysis_id not in analyses_db:
         raise HTTPException(status_code=404, detail="Analysis not found")
-    return analyses_db[analysis_id]
+    return Response(content=analyses_db[analysis_id], media_type="application/json")
 
 # =============================================================================
 # Run Application
@@ -414,4 +642,6 @@ async def get_analysis(analysis_id: str):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop and httptools give a C event loop and HTTP parser, worth
+    # 2-3x raw throughput on small JSON endpoints over the defaults
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -351,12 +351,39 @@ async function sendChatMessage() {
         });
         
         if (!response.ok) throw new Error('Chat request failed');
-        
-        const result = await response.json();
+
+        // Response is a Server-Sent Events stream of {delta} chunks
         removeTypingIndicator(typingId);
-        addChatMessage(result.response, 'assistant');
-        state.chatContext += `\nUser: ${message}\nAssistant: ${result.response}`;
-        
+        const contentEl = addChatMessage('', 'assistant');
+        const container = document.getElementById('chat-messages');
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let fullResponse = '';
+        let buffer = '';
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            const events = buffer.split('\n\n');
+            buffer = events.pop();
+            for (const event of events) {
+                if (!event.startsWith('data: ')) continue;
+                const data = event.slice(6);
+                if (data === '[DONE]') continue;
+                const delta = JSON.parse(data).delta;
+                if (delta) {
+                    fullResponse += delta;
+                    contentEl.innerHTML = formatMessageContent(fullResponse);
+                    container.scrollTop = container.scrollHeight;
+                }
+            }
+        }
+
+        state.chatContext += `\nUser: ${message}\nAssistant: ${fullResponse}`;
+
     } catch (error) {
         console.error('Error:', error);
         removeTypingIndicator(typingId);
@@ -384,6 +411,7 @@ function addChatMessage(content, role) {
     
     container.insertAdjacentHTML('beforeend', messageHtml);
     container.scrollTop = container.scrollHeight;
+    return container.lastElementChild.querySelector('.message-content p');
 }
 
 function formatMessageContent(content) {